@@ -178,6 +178,7 @@ class SerenaAgent:
 
         # project-specific instances, which will be initialized upon project activation
         self._active_project: Project | None = None
+        self._language_server_manager_init_task: TaskExecutor.Task[None] | None = None
 
         # adjust log level
         serena_log_level = self.serena_config.log_level
@@ -316,6 +317,19 @@ class SerenaAgent:
             )
         return language_server_manager
 
+    def wait_for_language_server_manager(self, timeout: float | None = None) -> LanguageServerManager:
+        """
+        Blocks until the language server manager of the active project has been initialized (which happens asynchronously
+        upon project activation) and returns it.
+        If the initialization failed, the respective exception is raised; if the timeout is reached, a TimeoutError is raised.
+
+        :param timeout: the maximum time to wait in seconds, or None to wait indefinitely
+        :return: the language server manager
+        """
+        if self._language_server_manager_init_task is not None:
+            self._language_server_manager_init_task.result(timeout=timeout)
+        return self.get_language_server_manager_or_raise()
+
     def get_context(self) -> SerenaAgentContext:
         return self._context
 
@@ -522,7 +536,7 @@ class SerenaAgent:
 
         # initialize the language server in the background (if in language server mode)
         if self.is_using_language_server():
-            self.issue_task(init_language_server_manager)
+            self._language_server_manager_init_task = self.issue_task(init_language_server_manager)
 
         if self._project_activation_callback is not None:
             self._project_activation_callback()
@@ -669,11 +683,25 @@ class SerenaAgent:
         self.issue_task(lambda: self.get_active_project_or_raise().remove_language(language), name=f"RemoveLanguage:{language.value}")
 
     def get_tool(self, tool_class: type[TTool]) -> TTool:
+        """
+        :param tool_class: the class of the tool to retrieve
+        :return: the agent's instance of the given tool class; tool instances are created once
+            (upon agent construction), so repeated calls return the same instance
+        """
         return self._all_tools[tool_class]  # type: ignore
 
     def print_tool_overview(self) -> None:
         ToolRegistry().print_tool_overview(self._active_tools.values())
 
+    def shutdown(self) -> None:
+        """
+        Shuts down the language servers of the active project (if any), saving their caches.
+        The project remains active; its language servers are restarted upon reactivation.
+        """
+        if self._active_project is not None:
+            log.info(f"Shutting down language servers of project {self._active_project.project_name}")
+            self._active_project.shutdown()
+
     def __del__(self) -> None:
         """
         Destructor to clean up the language server instance and GUI logger
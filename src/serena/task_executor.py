@@ -1,6 +1,5 @@
 import concurrent.futures
 import threading
-import time
 from collections.abc import Callable
 from concurrent.futures import Future
 from dataclasses import dataclass
@@ -19,6 +18,10 @@ class TaskExecutor:
     def __init__(self, name: str):
         self._task_executor_lock = threading.Lock()
         self._task_executor_queue: list[TaskExecutor.Task] = []
+        self._task_executor_queue_condition = threading.Condition(self._task_executor_lock)
+        """
+        condition (sharing the executor lock) which is notified whenever a task is added to the queue
+        """
         self._task_executor_thread = Thread(target=self._process_task_queue, name=name, daemon=True)
         self._task_executor_thread.start()
         self._task_executor_task_index = 1
@@ -107,18 +110,13 @@ class TaskExecutor:
 
     def _process_task_queue(self) -> None:
         while True:
-            # obtain task from the queue
-            task: TaskExecutor.Task | None = None
-            with self._task_executor_lock:
-                if len(self._task_executor_queue) > 0:
-                    task = self._task_executor_queue.pop(0)
-            if task is None:
-                time.sleep(0.1)
-                continue
+            # obtain task from the queue, blocking until a task is available
+            with self._task_executor_queue_condition:
+                self._task_executor_queue_condition.wait_for(lambda: len(self._task_executor_queue) > 0)
+                task = self._task_executor_queue.pop(0)
+                self._task_executor_current_task = task
 
             # start task execution asynchronously
-            with self._task_executor_lock:
-                self._task_executor_current_task = task
             if task.logged:
                 log.info("Starting execution of %s", task.name)
             task.start()
@@ -192,6 +190,7 @@ class TaskExecutor:
                 log.info(f"Scheduling {task_name}")
             task_obj = self.Task(function=task, name=task_name, logged=logged, timeout=timeout)
             self._task_executor_queue.append(task_obj)
+            self._task_executor_queue_condition.notify()
             return task_obj
 
     def execute_task(self, task: Callable[[], T], name: str | None = None, logged: bool = True, timeout: float | None = None) -> T:
@@ -1,4 +1,6 @@
+import bisect
 import fnmatch
+import functools
 import logging
 import os
 import re
@@ -136,7 +138,7 @@ def glob_to_regex(glob_pat: str) -> str:
 
 
 def search_text(
-    pattern: str,
+    pattern: str | re.Pattern[str],
     content: str | None = None,
     source_file_path: str | None = None,
     allow_multiline_match: bool = False,
@@ -147,7 +149,8 @@ def search_text(
     """
     Search for a pattern in text content. Supports both regex and glob-like patterns.
 
-    :param pattern: Pattern to search for (regex or glob-like pattern)
+    :param pattern: Pattern to search for (regex or glob-like pattern), either as a string or as a compiled Pattern.
+        A compiled pattern is used as is, i.e. it is up to the caller to compile it with re.DOTALL for multiline matching.
     :param content: The text content to search. May be None if source_file_path is provided.
     :param source_file_path: Optional path to the source file. If content is None,
         this has to be passed and the file will be read.
@@ -176,18 +179,24 @@ def search_text(
 
     # Convert pattern to a compiled regex if it's a string
     if is_glob:
+        assert isinstance(pattern, str), "Glob patterns must be passed as strings"
         pattern = glob_to_regex(pattern)
     if allow_multiline_match:
         # For multiline matches, we need to use the DOTALL flag to make '.' match newlines
-        compiled_pattern = re.compile(pattern, re.DOTALL)
+        compiled_pattern = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, re.DOTALL)
+        # Offsets of all newline characters, which allow us to determine the line number of a position
+        # via binary search (instead of counting the newlines preceding each match)
+        newline_offsets: list[int] | None = None
         # Search across the entire content as a single string
         for match in compiled_pattern.finditer(content):
             start_pos = match.start()
             end_pos = match.end()
 
             # Find the line numbers for the start and end positions
-            start_line_num = content[:start_pos].count("\n") + 1
-            end_line_num = content[:end_pos].count("\n") + 1
+            if newline_offsets is None:
+                newline_offsets = [m.start() for m in re.finditer("\n", content)]
+            start_line_num = bisect.bisect_left(newline_offsets, start_pos) + 1
+            end_line_num = bisect.bisect_left(newline_offsets, end_pos) + 1
 
             # Calculate the range of lines to include in the context
             context_start = max(1, start_line_num - context_lines_before)
@@ -211,7 +220,7 @@ def search_text(
         # TODO: extremely inefficient! Since we currently don't use this option in SerenaAgent or LanguageServer,
         #   it is not urgent to fix, but should be either improved or the option should be removed.
         # Search line by line, normal compile without DOTALL
-        compiled_pattern = re.compile(pattern)
+        compiled_pattern = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern)
         for i, line in enumerate(lines):
             line_num = i + 1
             if compiled_pattern.search(line):
@@ -266,6 +275,15 @@ def expand_braces(pattern: str) -> list[str]:
     return patterns
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """
+    :param pattern: a glob pattern (without brace expansion)
+    :return: the compiled regular expression corresponding to the pattern as per fnmatch
+    """
+    return re.compile(fnmatch.translate(pattern))
+
+
 def glob_match(pattern: str, path: str) -> bool:
     """
     Match a file path against a glob pattern.
@@ -293,24 +311,21 @@ def glob_match(pattern: str, path: str) -> bool:
     # Handle ** patterns that should match zero or more directories
     if "**" in pattern:
         # Method 1: Standard fnmatch (matches one or more directories)
-        regex1 = fnmatch.translate(pattern)
-        if re.match(regex1, path):
+        if _compile_glob(pattern).match(path):
             return True
 
         # Method 2: Handle zero-directory case by removing /** entirely
         # Convert "src/**/test.py" to "src/test.py"
         if "/**/" in pattern:
             zero_dir_pattern = pattern.replace("/**/", "/")
-            regex2 = fnmatch.translate(zero_dir_pattern)
-            if re.match(regex2, path):
+            if _compile_glob(zero_dir_pattern).match(path):
                 return True
 
         # Method 3: Handle leading ** case by removing **/
         # Convert "**/test.py" to "test.py"
         if pattern.startswith("**/"):
             zero_dir_pattern = pattern[3:]  # Remove "**/"
-            regex3 = fnmatch.translate(zero_dir_pattern)
-            if re.match(regex3, path):
+            if _compile_glob(zero_dir_pattern).match(path):
                 return True
 
         return False
@@ -321,7 +336,7 @@ def glob_match(pattern: str, path: str) -> bool:
 
 def search_files(
     relative_file_paths: list[str],
-    pattern: str,
+    pattern: str | re.Pattern[str],
     root_path: str = "",
     file_reader: Callable[[str], str] = default_file_reader,
     context_lines_before: int = 0,
@@ -333,7 +348,8 @@ def search_files(
     Search for a pattern in a list of files.
 
     :param relative_file_paths: List of relative file paths in which to search
-    :param pattern: Pattern to search for
+    :param pattern: Pattern to search for, either as a string or as a compiled Pattern (which should use re.DOTALL,
+        as matches may span multiple lines)
     :param root_path: Root path to resolve relative paths against (by default, current working directory).
     :param file_reader: Function to read a file, by default will just use os.open.
         All files that can't be read by it will be skipped.
@@ -342,6 +358,7 @@ def search_files(
     :param paths_include_glob: Optional glob pattern to include files from the list
     :param paths_exclude_glob: Optional glob pattern to exclude files from the list
     :return: List of MatchedConsecutiveLines objects
+    :raises re.error: if the pattern is not a valid regular expression (raised before any file is read)
     """
     # Pre-filter paths (done sequentially to avoid overhead)
     # Use proper glob matching instead of gitignore patterns
@@ -364,13 +381,16 @@ def search_files(
 
     log.info(f"Processing {len(filtered_paths)} files.")
 
+    # compile the pattern once rather than once per file
+    compiled_pattern = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, re.DOTALL)
+
     def process_single_file(path: str) -> dict[str, Any]:
         """Process a single file - this function will be parallelized."""
         try:
             abs_path = os.path.join(root_path, path)
             file_content = file_reader(abs_path)
             search_results = search_text(
-                pattern,
+                compiled_pattern,
                 content=file_content,
                 source_file_path=path,
                 allow_multiline_match=True,
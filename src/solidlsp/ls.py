@@ -1683,7 +1683,7 @@ class SolidLanguageServer(ABC):
             self._raw_document_symbols_cache_is_modified = False
         except Exception as e:
             log.error(
-                "Failed to save raw document symbols cache to %s: %s. Note: this may have resulted in a corrupted cache file.",
+                "Failed to save raw document symbols cache to %s: %s",
                 cache_file,
                 e,
             )
@@ -1749,7 +1749,7 @@ class SolidLanguageServer(ABC):
             self._document_symbols_cache_is_modified = False
         except Exception as e:
             log.error(
-                "Failed to save document symbols cache to %s: %s. Note: this may have resulted in a corrupted cache file.",
+                "Failed to save document symbols cache to %s: %s",
                 cache_file,
                 e,
             )
@@ -3,6 +3,9 @@ Configuration objects for language servers
 """
 
 import fnmatch
+import functools
+import os
+import re
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
@@ -18,12 +21,16 @@ class FilenameMatcher:
         :param patterns: fnmatch-compatible patterns
         """
         self.patterns = patterns
+        # the patterns are combined into a single regular expression, such that a filename is matched in one pass
+        # (case normalisation is applied as in fnmatch.fnmatch)
+        self._regex: re.Pattern[str] | None = None
+        if patterns:
+            self._regex = re.compile("|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns))
 
     def is_relevant_filename(self, fn: str) -> bool:
-        for pattern in self.patterns:
-            if fnmatch.fnmatch(fn, pattern):
-                return True
-        return False
+        if self._regex is None:
+            return False
+        return self._regex.match(os.path.normcase(fn)) is not None
 
 
 class Language(str, Enum):
@@ -98,7 +105,12 @@ class Language(str, Enum):
     def __str__(self) -> str:
         return self.value
 
+    @functools.cache
     def get_source_fn_matcher(self) -> FilenameMatcher:
+        """
+        :return: the matcher for the source files of this language (created once per language and reused,
+            as it is queried for every file when walking a project)
+        """
         match self:
             case self.PYTHON | self.PYTHON_JEDI:
                 return FilenameMatcher("*.py", "*.pyi")
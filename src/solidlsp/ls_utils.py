@@ -419,3 +419,20 @@ class SymbolUtils:
             if SymbolUtils.symbol_tree_contains_name(symbol["children"], name):
                 return True
         return False
+
+    @staticmethod
+    def get_symbol_tree_names(roots: list[UnifiedSymbolInformation]) -> set[str]:
+        """
+        Collects the names of all symbols in the given symbol trees in a single traversal.
+        This is preferable to repeated calls of :meth:`symbol_tree_contains_name` when checking for several names.
+
+        :param roots: the root symbols of the trees
+        :return: the set of names of all symbols (roots and descendants)
+        """
+        names = set()
+        stack = list(roots)
+        while stack:
+            symbol = stack.pop()
+            names.add(symbol["name"])
+            stack.extend(symbol["children"])
+        return names
@@ -1,23 +1,58 @@
 import logging
+import os
+import pickle
+import tempfile
 from typing import Any, Optional
 
-from sensai.util.pickle import dump_pickle, load_pickle
-
 log = logging.getLogger(__name__)
 
 
 def load_cache(path: str, version: Any) -> Optional[Any]:
-    data = load_pickle(path)
-    if not isinstance(data, dict) or "__cache_version" not in data:
-        log.info("Cache is outdated (expected version %s). Ignoring cache at %s", version, path)
-        return None
-    saved_version = data["__cache_version"]
-    if saved_version != version:
-        log.info("Cache is outdated (expected version %s, got %s). Ignoring cache at %s", version, saved_version, path)
-        return None
-    return data["obj"]
+    """
+    Loads a cache that was saved with :func:`save_cache`.
+    The version is stored ahead of the cached object, such that an outdated cache can be rejected without
+    unpickling the (potentially large) cached object.
+
+    :param path: the path of the cache file
+    :param version: the expected cache version
+    :return: the cached object or None if the cache is outdated
+    """
+    with open(path, "rb") as f:
+        saved_version = pickle.load(f)
+        legacy_data = None
+        if isinstance(saved_version, dict) and "__cache_version" in saved_version:
+            # legacy format, in which version and object were stored in a single dictionary
+            legacy_data = saved_version
+            saved_version = legacy_data["__cache_version"]
+        if saved_version != version:
+            log.info("Cache is outdated (expected version %s, got %s). Ignoring cache at %s", version, saved_version, path)
+            return None
+        if legacy_data is not None:
+            return legacy_data["obj"]
+        return pickle.load(f)
 
 
 def save_cache(path: str, version: Any, obj: Any) -> None:
-    data = {"__cache_version": version, "obj": obj}
-    dump_pickle(data, path)
+    """
+    Saves the given object to a cache file, storing the version ahead of the object.
+    The file is written to a temporary file first and then moved into place, such that concurrent readers
+    (e.g. other processes using the same project) never observe a partially written cache, and concurrent writers
+    do not interfere with each other.
+
+    :param path: the path of the cache file
+    :param version: the cache version
+    :param obj: the object to cache
+    """
+    dir_name = os.path.dirname(path)
+    if dir_name != "":
+        os.makedirs(dir_name, exist_ok=True)
+    # the temporary file is uniquely named and placed next to the target, such that the final move does not cross file systems
+    fd, tmp_path = tempfile.mkstemp(dir=dir_name or ".", prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(version, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
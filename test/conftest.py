@@ -1,3 +1,4 @@
+import functools
 import logging
 from pathlib import Path
 
@@ -14,6 +15,20 @@ from solidlsp.settings import SolidLSPSettings
 configure(level=logging.ERROR)
 
 
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """
+    Assigns each language-specific test to an xdist group named after its language.
+    When running in parallel with `--dist loadgroup`, all tests of a language thus run in the same worker,
+    such that the language server (shared via session-scoped fixtures) is started only once.
+    """
+    language_names = {str(language) for language in Language}
+    for item in items:
+        for marker in item.iter_markers():
+            if marker.name in language_names:
+                item.add_marker(pytest.mark.xdist_group(marker.name))
+                break
+
+
 @pytest.fixture(scope="session")
 def resources_dir() -> Path:
     """Path to the test resources directory."""
@@ -25,6 +40,7 @@ class LanguageParamRequest:
     param: Language
 
 
+@functools.cache
 def get_repo_path(language: Language) -> Path:
     return Path(__file__).parent / "resources" / "repos" / language / "test_repo"
 
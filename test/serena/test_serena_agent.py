@@ -1,7 +1,6 @@
 import json
 import logging
 import os
-import time
 
 import pytest
 
@@ -14,9 +13,12 @@ from solidlsp.ls_config import Language
 from test.conftest import get_repo_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def serena_config():
-    """Create an in-memory configuration for tests with test repositories pre-registered."""
+    """
+    Create an in-memory configuration for tests with test repositories pre-registered.
+    The configuration is built once per session, as agents only read the registered projects.
+    """
     # Create test projects for all supported languages
     test_projects = []
     for language in [
@@ -53,12 +55,22 @@ def serena_config():
     return config
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def serena_agent(request: pytest.FixtureRequest, serena_config):
+    """
+    Creates an agent for the test repository of the requested language, which is shared by all tests in the module
+    that request the same language (as the tests do not modify the repository), such that the language server
+    needs to be started only once per language.
+    """
     language = Language(request.param)
     project_name = f"test_repo_{language}"
 
-    return SerenaAgent(project=project_name, serena_config=serena_config)
+    agent = SerenaAgent(project=project_name, serena_config=serena_config)
+    try:
+        agent.wait_for_language_server_manager(timeout=serena_config.tool_timeout)
+        yield agent
+    finally:
+        agent.shutdown()
 
 
 class TestSerenaAgent:
@@ -82,6 +94,7 @@ class TestSerenaAgent:
             pytest.param(Language.CSHARP, "Calculator", "Class", "Program.cs", marks=pytest.mark.csharp),
         ],
         indirect=["serena_agent"],
+        scope="module",
     )
     def test_find_symbol(self, serena_agent, symbol_name: str, expected_kind: str, expected_file: str):
         agent = serena_agent
@@ -89,8 +102,9 @@ class TestSerenaAgent:
         result = find_symbol_tool.apply_ex(name_path_pattern=symbol_name)
 
         symbols = json.loads(result)
+        expected_kind_lower = expected_kind.lower()
         assert any(
-            symbol_name in s["name_path"] and expected_kind.lower() in s["kind"].lower() and expected_file in s["relative_path"]
+            expected_file in s["relative_path"] and symbol_name in s["name_path"] and expected_kind_lower in s["kind"].lower()
             for s in symbols
         ), f"Expected to find {symbol_name} ({expected_kind}) in {expected_file}"
 
@@ -132,6 +146,7 @@ class TestSerenaAgent:
             pytest.param(Language.CSHARP, "Calculator", "Program.cs", "Program.cs", marks=pytest.mark.csharp),
         ],
         indirect=["serena_agent"],
+        scope="module",
     )
     def test_find_symbol_references(self, serena_agent, symbol_name: str, def_file: str, ref_file: str) -> None:
         agent = serena_agent
@@ -139,8 +154,6 @@ class TestSerenaAgent:
         # Find the symbol location first
         find_symbol_tool = agent.get_tool(FindSymbolTool)
         result = find_symbol_tool.apply_ex(name_path_pattern=symbol_name, relative_path=def_file)
-
-        time.sleep(1)
         symbols = json.loads(result)
         # Find the definition
         def_symbol = symbols[0]
@@ -150,9 +163,8 @@ class TestSerenaAgent:
         result = find_refs_tool.apply_ex(name_path=def_symbol["name_path"], relative_path=def_symbol["relative_path"])
 
         refs = json.loads(result)
-        assert any(
-            ref["relative_path"] == ref_file for ref in refs
-        ), f"Expected to find reference to {symbol_name} in {ref_file}. refs={refs}"
+        ref_paths = {ref["relative_path"] for ref in refs}
+        assert ref_file in ref_paths, f"Expected to find reference to {symbol_name} in {ref_file}. refs={refs}"
 
     @pytest.mark.parametrize(
         "serena_agent,name_path,substring_matching,expected_symbol_name,expected_kind,expected_file",
@@ -219,6 +231,7 @@ class TestSerenaAgent:
             ),
         ],
         indirect=["serena_agent"],
+        scope="module",
     )
     def test_find_symbol_name_path(
         self,
@@ -232,21 +245,14 @@ class TestSerenaAgent:
         agent = serena_agent
 
         find_symbol_tool = agent.get_tool(FindSymbolTool)
-        result = find_symbol_tool.apply_ex(
-            name_path_pattern=name_path,
-            depth=0,
-            relative_path=None,
-            include_body=False,
-            include_kinds=None,
-            exclude_kinds=None,
-            substring_matching=substring_matching,
-        )
+        result = find_symbol_tool.apply_ex(name_path_pattern=name_path, substring_matching=substring_matching)
 
         symbols = json.loads(result)
+        expected_kind_lower = expected_kind.lower()
         assert any(
-            expected_symbol_name == s["name_path"].split("/")[-1]
-            and expected_kind.lower() in s["kind"].lower()
-            and expected_file in s["relative_path"]
+            expected_file in s["relative_path"]
+            and expected_symbol_name == s["name_path"].rsplit("/", 1)[-1]
+            and expected_kind_lower in s["kind"].lower()
             for s in symbols
         ), f"Expected to find {name_path} ({expected_kind}) in {expected_file}. Symbols: {symbols}"
 
@@ -267,6 +273,7 @@ class TestSerenaAgent:
             ),
         ],
         indirect=["serena_agent"],
+        scope="module",
     )
     def test_find_symbol_name_path_no_match(
         self,
@@ -276,11 +283,7 @@ class TestSerenaAgent:
         agent = serena_agent
 
         find_symbol_tool = agent.get_tool(FindSymbolTool)
-        result = find_symbol_tool.apply_ex(
-            name_path_pattern=name_path,
-            depth=0,
-            substring_matching=True,
-        )
+        result = find_symbol_tool.apply_ex(name_path_pattern=name_path, substring_matching=True)
 
         symbols = json.loads(result)
         assert not symbols, f"Expected to find no symbols for {name_path}. Symbols found: {symbols}"
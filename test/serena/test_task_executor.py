@@ -1,3 +1,4 @@
+import threading
 import time
 
 import pytest
@@ -18,14 +19,25 @@ class Task:
         self.delay = delay
         self.exception = exception
         self.did_run = False
+        self.started = threading.Event()
+        self._stop_event = threading.Event()
 
     def run(self):
         self.did_run = True
-        time.sleep(self.delay)
+        self.started.set()
+        # wait interruptibly, such that the thread of a cancelled task can be stopped early
+        if self._stop_event.wait(self.delay):
+            return False
         if self.exception:
             raise ValueError("Task failed")
         return True
 
+    def stop(self) -> None:
+        """
+        Stops a running task (cancelling a task via the executor only marks its future as cancelled)
+        """
+        self._stop_event.set()
+
 
 def test_task_executor_sequence(executor):
     """
@@ -62,20 +74,24 @@ def test_task_executor_cancel_current(executor):
       * the cancelled task raises CancelledError when result() is called.
     """
     start_time = time.time()
-    future1 = executor.issue_task(Task(10).run, name="task1")
+    task1 = Task(10)
+    future1 = executor.issue_task(task1.run, name="task1")
     future2 = executor.issue_task(Task(1).run, name="task2")
-    time.sleep(1)
-    future1.cancel()
-    assert future2.result() is True
-    end_time = time.time()
-    assert (end_time - start_time) < 9, "Cancelled task did not stop in time"
-    have_cancelled_error = False
     try:
-        future1.result()
-    except Exception as e:
-        assert e.__class__.__name__ == "CancelledError"
-        have_cancelled_error = True
-    assert have_cancelled_error
+        assert task1.started.wait(timeout=5)
+        future1.cancel()
+        assert future2.result() is True
+        end_time = time.time()
+        assert (end_time - start_time) < 9, "Cancelled task did not stop in time"
+        have_cancelled_error = False
+        try:
+            future1.result()
+        except Exception as e:
+            assert e.__class__.__name__ == "CancelledError"
+            have_cancelled_error = True
+        assert have_cancelled_error
+    finally:
+        task1.stop()
 
 
 def test_task_executor_cancel_future(executor):
@@ -86,41 +102,50 @@ def test_task_executor_cancel_future(executor):
     task2 = Task(1)
     future1 = executor.issue_task(task1.run, name="task1")
     future2 = executor.issue_task(task2.run, name="task2")
-    time.sleep(1)
-    future2.cancel()
-    future1.cancel()
     try:
-        future2.result()
-    except:
-        pass
-    assert task1.did_run
-    assert not task2.did_run
+        assert task1.started.wait(timeout=5)
+        future2.cancel()
+        future1.cancel()
+        try:
+            future2.result()
+        except:
+            pass
+        assert task1.did_run
+        assert not task2.did_run
+    finally:
+        task1.stop()
 
 
 def test_task_executor_cancellation_via_task_info(executor):
     start_time = time.time()
-    executor.issue_task(Task(10).run, "task1")
-    executor.issue_task(Task(10).run, "task2")
-    task_infos = executor.get_current_tasks()
-    task_infos2 = executor.get_current_tasks()
-
-    # test expected tasks
-    assert len(task_infos) == 2
-    assert "task1" in task_infos[0].name
-    assert "task2" in task_infos[1].name
-
-    # test task identifiers being stable
-    assert task_infos2[0].task_id == task_infos[0].task_id
-
-    # test cancellation
-    task_infos[0].cancel()
-    time.sleep(0.5)
-    task_infos3 = executor.get_current_tasks()
-    assert len(task_infos3) == 1  # Cancelled task is gone from the queue
-    task_infos3[0].cancel()
+    task1 = Task(10)
+    task2 = Task(10)
     try:
-        task_infos3[0].future.result()
-    except:
-        pass
-    end_time = time.time()
-    assert (end_time - start_time) < 9, "Cancelled task did not stop in time"
+        executor.issue_task(task1.run, "task1")
+        executor.issue_task(task2.run, "task2")
+        task_infos = executor.get_current_tasks()
+        task_infos2 = executor.get_current_tasks()
+
+        # test expected tasks
+        assert len(task_infos) == 2
+        assert "task1" in task_infos[0].name
+        assert "task2" in task_infos[1].name
+
+        # test task identifiers being stable
+        assert task_infos2[0].task_id == task_infos[0].task_id
+
+        # test cancellation
+        task_infos[0].cancel()
+        time.sleep(0.5)
+        task_infos3 = executor.get_current_tasks()
+        assert len(task_infos3) == 1  # Cancelled task is gone from the queue
+        task_infos3[0].cancel()
+        try:
+            task_infos3[0].future.result()
+        except:
+            pass
+        end_time = time.time()
+        assert (end_time - start_time) < 9, "Cancelled task did not stop in time"
+    finally:
+        task1.stop()
+        task2.stop()
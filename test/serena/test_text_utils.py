@@ -126,6 +126,22 @@ class TestSearchText:
         match_lines = [line for line in multiline_match.lines if line.match_type == LineType.MATCH]
         assert len(match_lines) >= 3
 
+    def test_search_text_with_compiled_pattern(self):
+        """Test that a precompiled pattern is used as is."""
+        content = """
+        def factorial(n):
+            if n <= 1:
+                return 1
+            else:
+                return n * factorial(n-1)
+        """
+
+        matches = search_text(re.compile(r"if.*?else", re.DOTALL), content=content, allow_multiline_match=True)
+
+        assert len(matches) == 1
+        assert matches[0].num_matched_lines == 3
+        assert matches == search_text(r"if.*?else", content=content, allow_multiline_match=True)
+
     def test_search_text_with_glob_pattern(self):
         """Test searching with glob-like patterns."""
         content = """
@@ -437,6 +453,22 @@ class TestSearchFiles:
         )
         assert len(results) == 0, "Should not find matches if pattern doesn't match content"
 
+    def test_search_files_invalid_pattern_raises(self):
+        """Test that an invalid regex pattern raises re.error up front instead of skipping every file."""
+        read_paths = []
+
+        def recording_reader(file_path: str) -> str:
+            read_paths.append(file_path)
+            return "foo(bar)"
+
+        with pytest.raises(re.error):
+            search_files(
+                relative_file_paths=["a.py", "b.py"],
+                pattern="foo(",
+                file_reader=recording_reader,
+            )
+        assert read_paths == [], "No file should be read if the pattern cannot be compiled"
+
     def test_search_files_regex_pattern_with_filters(self):
         """Test using a regex pattern works correctly along with include/exclude filters."""
 
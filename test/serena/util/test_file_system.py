@@ -22,7 +22,7 @@ class TestGitignoreParser:
     def teardown_method(self):
         """Clean up test environment after each test method."""
         # Remove the temporary directory
-        shutil.rmtree(self.test_dir)
+        shutil.rmtree(self.test_dir, ignore_errors=True)
 
     def _create_repo_structure(self):
         """
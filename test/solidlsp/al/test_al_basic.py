@@ -1,4 +1,5 @@
 import os
+import re
 
 import pytest
 
@@ -13,31 +14,24 @@ class TestALLanguageServer:
     def test_find_symbol(self, language_server: SolidLanguageServer) -> None:
         """Test that AL Language Server can find symbols in the test repository."""
         symbols = language_server.request_full_symbol_tree()
+        symbol_names = SymbolUtils.get_symbol_tree_names(symbols)
 
         # Check for table symbols - AL returns full object names like 'Table 50000 "TEST Customer"'
-        assert SymbolUtils.symbol_tree_contains_name(symbols, 'Table 50000 "TEST Customer"'), "TEST Customer table not found in symbol tree"
+        assert 'Table 50000 "TEST Customer"' in symbol_names, "TEST Customer table not found in symbol tree"
 
         # Check for page symbols
-        assert SymbolUtils.symbol_tree_contains_name(
-            symbols, 'Page 50001 "TEST Customer Card"'
-        ), "TEST Customer Card page not found in symbol tree"
-        assert SymbolUtils.symbol_tree_contains_name(
-            symbols, 'Page 50002 "TEST Customer List"'
-        ), "TEST Customer List page not found in symbol tree"
+        assert 'Page 50001 "TEST Customer Card"' in symbol_names, "TEST Customer Card page not found in symbol tree"
+        assert 'Page 50002 "TEST Customer List"' in symbol_names, "TEST Customer List page not found in symbol tree"
 
         # Check for codeunit symbols
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "Codeunit 50000 CustomerMgt"), "CustomerMgt codeunit not found in symbol tree"
-        assert SymbolUtils.symbol_tree_contains_name(
-            symbols, "Codeunit 50001 PaymentProcessorImpl"
-        ), "PaymentProcessorImpl codeunit not found in symbol tree"
+        assert "Codeunit 50000 CustomerMgt" in symbol_names, "CustomerMgt codeunit not found in symbol tree"
+        assert "Codeunit 50001 PaymentProcessorImpl" in symbol_names, "PaymentProcessorImpl codeunit not found in symbol tree"
 
         # Check for enum symbol
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "Enum 50000 CustomerType"), "CustomerType enum not found in symbol tree"
+        assert "Enum 50000 CustomerType" in symbol_names, "CustomerType enum not found in symbol tree"
 
         # Check for interface symbol
-        assert SymbolUtils.symbol_tree_contains_name(
-            symbols, "Interface IPaymentProcessor"
-        ), "IPaymentProcessor interface not found in symbol tree"
+        assert "Interface IPaymentProcessor" in symbol_names, "IPaymentProcessor interface not found in symbol tree"
 
     @pytest.mark.parametrize("language_server", [Language.AL], indirect=True)
     def test_find_table_fields(self, language_server: SolidLanguageServer) -> None:
@@ -132,27 +126,24 @@ class TestALLanguageServer:
 
         # Count how many AL-specific symbols we found
         al_symbols = []
-
-        def collect_symbols(syms):
-            for sym in syms:
-                if isinstance(sym, dict):
-                    name = sym.get("name", "")
-                    # Look for AL object names (Table, Page, Codeunit, etc.)
-                    if any(keyword in name for keyword in ["Table", "Page", "Codeunit", "Enum", "Interface"]):
-                        al_symbols.append(name)
-                    if "children" in sym:
-                        collect_symbols(sym["children"])
-
-        collect_symbols(symbols)
+        # Look for AL object names (Table, Page, Codeunit, etc.)
+        al_object_pattern = re.compile("Table|Page|Codeunit|Enum|Interface")
+        al_object_types = set()
+        stack = list(symbols)
+        while stack:
+            sym = stack.pop()
+            if isinstance(sym, dict):
+                name = sym.get("name", "")
+                object_types = al_object_pattern.findall(name)
+                if object_types:
+                    al_symbols.append(name)
+                    al_object_types.update(object_types)
+                stack.extend(sym.get("children", ()))
 
         # We should find symbols from multiple files
         assert len(al_symbols) >= 5, f"Expected at least 5 AL object symbols, found {len(al_symbols)}: {al_symbols}"
 
         # Verify we have symbols from different AL object types
-        has_table = any("Table" in s for s in al_symbols)
-        has_page = any("Page" in s for s in al_symbols)
-        has_codeunit = any("Codeunit" in s for s in al_symbols)
-
-        assert has_table, f"No Table symbols found in: {al_symbols}"
-        assert has_page, f"No Page symbols found in: {al_symbols}"
-        assert has_codeunit, f"No Codeunit symbols found in: {al_symbols}"
+        assert "Table" in al_object_types, f"No Table symbols found in: {al_symbols}"
+        assert "Page" in al_object_types, f"No Page symbols found in: {al_symbols}"
+        assert "Codeunit" in al_object_types, f"No Codeunit symbols found in: {al_symbols}"
@@ -16,28 +16,28 @@ from solidlsp.ls_utils import SymbolUtils
 pytestmark = pytest.mark.fortran
 
 
+@pytest.mark.parametrize("language_server", [Language.FORTRAN], indirect=True)
 class TestFortranLanguageServer:
     """Test Fortran language server functionality."""
 
-    @pytest.mark.parametrize("language_server", [Language.FORTRAN], indirect=True)
     def test_find_symbol(self, language_server: SolidLanguageServer) -> None:
         """Test finding symbols using request_full_symbol_tree."""
         symbols = language_server.request_full_symbol_tree()
+        symbol_names = SymbolUtils.get_symbol_tree_names(symbols)
 
         # Verify program symbol
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "test_program"), "test_program not found in symbol tree"
+        assert "test_program" in symbol_names, "test_program not found in symbol tree"
 
         # Verify module symbol
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "math_utils"), "math_utils module not found in symbol tree"
+        assert "math_utils" in symbol_names, "math_utils module not found in symbol tree"
 
         # Verify function symbols
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "add_numbers"), "add_numbers function not found in symbol tree"
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "multiply_numbers"), "multiply_numbers function not found in symbol tree"
+        assert "add_numbers" in symbol_names, "add_numbers function not found in symbol tree"
+        assert "multiply_numbers" in symbol_names, "multiply_numbers function not found in symbol tree"
 
         # Verify subroutine symbol
-        assert SymbolUtils.symbol_tree_contains_name(symbols, "print_result"), "print_result subroutine not found in symbol tree"
+        assert "print_result" in symbol_names, "print_result subroutine not found in symbol tree"
 
-    @pytest.mark.parametrize("language_server", [Language.FORTRAN], indirect=True)
     def test_request_document_symbols(self, language_server: SolidLanguageServer) -> None:
         """Test that document symbols can be retrieved from Fortran files."""
         # Test main.f90 - should have a program symbol
@@ -53,18 +53,17 @@ class TestFortranLanguageServer:
         assert "multiply_numbers" in all_names, f"Function 'multiply_numbers' not found. Found: {all_names}"
         assert "print_result" in all_names, f"Subroutine 'print_result' not found. Found: {all_names}"
 
-    @pytest.mark.parametrize("language_server", [Language.FORTRAN], indirect=True)
     def test_find_references_cross_file(self, language_server: SolidLanguageServer) -> None:
         """Test finding references across files using low-level request_references.
 
         This tests the LSP textDocument/references capability.
         """
         file_path = "modules/math_utils.f90"
-        symbols = language_server.request_document_symbols(file_path).get_all_symbols_and_roots()
+        symbols, _ = language_server.request_document_symbols(file_path).get_all_symbols_and_roots()
 
         # Find the add_numbers function
         add_numbers_symbol = None
-        for sym in symbols[0]:
+        for sym in symbols:
             if sym.get("name") == "add_numbers":
                 add_numbers_symbol = sym
                 break
@@ -82,12 +81,10 @@ class TestFortranLanguageServer:
         assert len(refs) > 0, "Should find references to add_numbers function"
 
         # Verify that main.f90 references the function
-        main_refs = [ref for ref in refs if "main.f90" in ref.get("relativePath", "")]
-        assert (
-            len(main_refs) > 0
-        ), f"Expected to find reference in main.f90, but found references in: {[ref.get('relativePath') for ref in refs]}"
+        assert any(
+            "main.f90" in ref["relativePath"] for ref in refs
+        ), f"Expected to find reference in main.f90, but found references in: {[ref['relativePath'] for ref in refs]}"
 
-    @pytest.mark.parametrize("language_server", [Language.FORTRAN], indirect=True)
     def test_find_definition_cross_file(self, language_server: SolidLanguageServer) -> None:
         """Test finding definition across files using request_definition."""
         # In main.f90, line 7 (0-indexed: line 6) contains: result = add_numbers(5.0, 3.0)
@@ -113,7 +110,6 @@ class TestFortranLanguageServer:
             definition_location["range"]["start"]["line"] == 4
         ), f"Expected definition at line 4, but found at line {definition_location['range']['start']['line']}"
 
-    @pytest.mark.parametrize("language_server", [Language.FORTRAN], indirect=True)
     def test_request_referencing_symbols(self, language_server: SolidLanguageServer) -> None:
         """Test finding symbols that reference a function - Serena's high-level API.
 
@@ -160,7 +156,6 @@ class TestFortranLanguageServer:
         # because it depends on finding containing symbols for each reference. We verify that
         # the API works and returns valid symbols with proper structure.
 
-    @pytest.mark.parametrize("language_server", [Language.FORTRAN], indirect=True)
     def test_request_defining_symbol(self, language_server: SolidLanguageServer) -> None:
         """Test finding the defining symbol - Serena's high-level API.
 
@@ -189,7 +184,6 @@ class TestFortranLanguageServer:
         defining_path = defining_symbol["location"]["relativePath"]
         assert "math_utils.f90" in defining_path, f"Expected definition to be in math_utils.f90, but found in: {defining_path}"
 
-    @pytest.mark.parametrize("language_server", [Language.FORTRAN], indirect=True)
     def test_request_containing_symbol(self, language_server: SolidLanguageServer) -> None:
         """Test finding the containing symbol for a position in the code."""
         # Test finding the containing symbol for a position inside the add_numbers function
@@ -217,7 +211,6 @@ class TestFortranLanguageServer:
         assert "range" in location, "Location should contain range information"
         assert "start" in location["range"] and "end" in location["range"], "Range should have start and end positions"
 
-    @pytest.mark.parametrize("language_server", [Language.FORTRAN], indirect=True)
     def test_type_and_interface_symbols(self, language_server: SolidLanguageServer) -> None:
         """Test that type definitions and interfaces are properly recognized with corrected selectionRange.
 
@@ -233,29 +226,24 @@ class TestFortranLanguageServer:
         symbols, _ = language_server.request_document_symbols(file_path).get_all_symbols_and_roots()
 
         # Find type and interface symbols
-        type_names = []
+        types_by_name = {}
         interface_names = []
         for sym in symbols:
             if sym.get("kind") == SymbolKind.Class.value:  # Type definitions
-                type_names.append(sym.get("name"))
+                types_by_name[sym.get("name")] = sym
             elif sym.get("kind") == SymbolKind.Interface.value:  # Interfaces
                 interface_names.append(sym.get("name"))
 
         # Verify type definitions are found
-        assert "Point2D" in type_names, f"Simple type 'Point2D' not found. Found types: {type_names}"
-        assert "Circle" in type_names, f"Type with :: syntax 'Circle' not found. Found types: {type_names}"
-        assert "Point3D" in type_names, f"Type with extends 'Point3D' not found. Found types: {type_names}"
+        assert "Point2D" in types_by_name, f"Simple type 'Point2D' not found. Found types: {list(types_by_name)}"
+        assert "Circle" in types_by_name, f"Type with :: syntax 'Circle' not found. Found types: {list(types_by_name)}"
+        assert "Point3D" in types_by_name, f"Type with extends 'Point3D' not found. Found types: {list(types_by_name)}"
 
         # Verify interface is found
         assert "distance" in interface_names, f"Interface 'distance' not found. Found interfaces: {interface_names}"
 
         # Verify selectionRange is corrected for a type symbol
-        point3d_symbol = None
-        for sym in symbols:
-            if sym.get("name") == "Point3D":
-                point3d_symbol = sym
-                break
-
+        point3d_symbol = types_by_name.get("Point3D")
         assert point3d_symbol is not None, "Could not find 'Point3D' type symbol"
 
         # Use corrected selectionRange to find references
@@ -20,11 +20,32 @@ import pytest
 from solidlsp.ls import SolidLanguageServer
 from solidlsp.ls_config import Language
 
+# expected top-level symbols of src/Calculator.hs
+CALCULATOR_SYMBOLS = frozenset(
+    {
+        "Calculator",  # Data type
+        "add",  # Function: Int -> Int -> Int
+        "subtract",  # Function: Int -> Int -> Int
+        "multiply",  # Function: Int -> Int -> Int
+        "divide",  # Function: Int -> Int -> Maybe Int
+        "calculate",  # Function: Calculator -> String -> Int -> Int -> Maybe Int
+    }
+)
+# expected helper functions of src/Helper.hs (besides the module name, which may also appear)
+HELPER_SYMBOLS = frozenset(
+    {
+        "validateNumber",  # Function used by Calculator.add and Calculator.subtract
+        "isPositive",  # Predicate function
+        "isNegative",  # Predicate function used by absolute
+        "absolute",  # Function that uses isNegative
+    }
+)
+
 
 @pytest.mark.haskell
 @pytest.mark.skipif(sys.platform == "win32", reason="HLS not installed on Windows CI")
+@pytest.mark.parametrize("language_server", [Language.HASKELL], indirect=True)
 class TestHaskellLanguageServer:
-    @pytest.mark.parametrize("language_server", [Language.HASKELL], indirect=True)
     def test_calculator_module_symbols(self, language_server: SolidLanguageServer):
         """
         Test precise symbol discovery in Calculator.hs.
@@ -35,24 +56,15 @@ class TestHaskellLanguageServer:
         - Module structure
         """
         all_symbols, _ = language_server.request_document_symbols("src/Calculator.hs").get_all_symbols_and_roots()
-        symbol_names = {s["name"] for s in all_symbols}
-
-        # Verify exact set of expected top-level symbols
-        expected_symbols = {
-            "Calculator",  # Data type
-            "add",  # Function: Int -> Int -> Int
-            "subtract",  # Function: Int -> Int -> Int
-            "multiply",  # Function: Int -> Int -> Int
-            "divide",  # Function: Int -> Int -> Maybe Int
-            "calculate",  # Function: Calculator -> String -> Int -> Int -> Maybe Int
-        }
+        # index by name, keeping the first occurrence (e.g. the data type rather than its same-named constructor)
+        symbols_by_name = {s["name"]: s for s in reversed(all_symbols)}
 
         # Verify all expected symbols are present
-        missing = expected_symbols - symbol_names
+        missing = CALCULATOR_SYMBOLS - symbols_by_name.keys()
         assert not missing, f"Missing expected symbols in Calculator.hs: {missing}"
 
         # Verify Calculator data type exists
-        calculator_symbol = next((s for s in all_symbols if s["name"] == "Calculator"), None)
+        calculator_symbol = symbols_by_name.get("Calculator")
         assert calculator_symbol is not None, "Calculator data type not found"
 
         # The Calculator should be identified as a data type
@@ -63,7 +75,6 @@ class TestHaskellLanguageServer:
             23,
         ], f"Calculator should be a data type (kind 1, 5, or 23), got kind {calculator_symbol['kind']}"
 
-    @pytest.mark.parametrize("language_server", [Language.HASKELL], indirect=True)
     def test_helper_module_symbols(self, language_server: SolidLanguageServer):
         """
         Test precise symbol discovery in Helper.hs.
@@ -74,23 +85,14 @@ class TestHaskellLanguageServer:
         all_symbols, _ = language_server.request_document_symbols("src/Helper.hs").get_all_symbols_and_roots()
         symbol_names = {s["name"] for s in all_symbols}
 
-        # Verify expected helper functions (module name may also appear)
-        expected_symbols = {
-            "validateNumber",  # Function used by Calculator.add and Calculator.subtract
-            "isPositive",  # Predicate function
-            "isNegative",  # Predicate function used by absolute
-            "absolute",  # Function that uses isNegative
-        }
-
         # All expected symbols should be present (module name is optional)
-        missing = expected_symbols - symbol_names
+        missing = HELPER_SYMBOLS - symbol_names
         assert not missing, f"Missing expected symbols in Helper.hs: {missing}"
 
         # Verify no unexpected symbols beyond the module name
-        extra = symbol_names - expected_symbols - {"Helper"}
+        extra = symbol_names - HELPER_SYMBOLS - {"Helper"}
         assert not extra, f"Unexpected symbols in Helper.hs: {extra}"
 
-    @pytest.mark.parametrize("language_server", [Language.HASKELL], indirect=True)
     def test_main_module_imports(self, language_server: SolidLanguageServer):
         """
         Test that Main.hs properly references both Calculator and Helper modules.
@@ -103,7 +105,6 @@ class TestHaskellLanguageServer:
         # Main.hs should have the main function
         assert "main" in symbol_names, "Main.hs should contain 'main' function"
 
-    @pytest.mark.parametrize("language_server", [Language.HASKELL], indirect=True)
     def test_cross_file_references_validateNumber(self, language_server: SolidLanguageServer):
         """
         Test cross-file reference tracking for validateNumber function.
@@ -121,15 +122,13 @@ class TestHaskellLanguageServer:
         assert len(references) >= 2, f"Expected at least 2 references to validateNumber (used in add and subtract), got {len(references)}"
 
         # Verify we have references in Calculator.hs
-        reference_paths = [ref["relativePath"] for ref in references]
-        calculator_refs = [path for path in reference_paths if "Calculator.hs" in path]
+        calculator_refs = [ref for ref in references if "Calculator.hs" in ref["relativePath"]]
 
         assert len(calculator_refs) >= 2, (
             f"Expected at least 2 references in Calculator.hs (add and subtract functions), "
             f"got {len(calculator_refs)} references in Calculator.hs"
         )
 
-    @pytest.mark.parametrize("language_server", [Language.HASKELL], indirect=True)
     def test_within_file_references_isNegative(self, language_server: SolidLanguageServer):
         """
         Test within-file reference tracking for isNegative function.
@@ -144,12 +143,10 @@ class TestHaskellLanguageServer:
         assert len(references) >= 1, f"Expected at least 1 reference to isNegative (used in absolute), got {len(references)}"
 
         # All references should be in Helper.hs
-        reference_paths = [ref["relativePath"] for ref in references]
         assert all(
-            "Helper.hs" in path for path in reference_paths
-        ), f"All isNegative references should be in Helper.hs, got: {reference_paths}"
+            "Helper.hs" in ref["relativePath"] for ref in references
+        ), f"All isNegative references should be in Helper.hs, got: {[ref['relativePath'] for ref in references]}"
 
-    @pytest.mark.parametrize("language_server", [Language.HASKELL], indirect=True)
     def test_function_references_from_main(self, language_server: SolidLanguageServer):
         """
         Test that functions used in Main.hs can be traced back to their definitions.
@@ -166,13 +163,11 @@ class TestHaskellLanguageServer:
         # Should find references in Main.hs and possibly Calculator.hs (calculate function uses it)
         assert len(add_refs) >= 1, f"Expected at least 1 reference to 'add', got {len(add_refs)}"
 
-        add_ref_paths = [ref["relativePath"] for ref in add_refs]
         # Should have at least one reference in Main.hs or Calculator.hs
         assert any(
-            "Main.hs" in path or "Calculator.hs" in path for path in add_ref_paths
-        ), f"Expected 'add' to be referenced in Main.hs or Calculator.hs, got: {add_ref_paths}"
+            "Main.hs" in ref["relativePath"] or "Calculator.hs" in ref["relativePath"] for ref in add_refs
+        ), f"Expected 'add' to be referenced in Main.hs or Calculator.hs, got: {[ref['relativePath'] for ref in add_refs]}"
 
-    @pytest.mark.parametrize("language_server", [Language.HASKELL], indirect=True)
     def test_multiply_function_usage_in_calculate(self, language_server: SolidLanguageServer):
         """
         Test that multiply function usage is tracked within Calculator module.
@@ -190,12 +185,10 @@ class TestHaskellLanguageServer:
         assert len(multiply_refs) >= 1, f"Expected at least 1 reference to 'multiply', got {len(multiply_refs)}"
 
         # Should have reference in Calculator.hs (calculate function)
-        multiply_ref_paths = [ref["relativePath"] for ref in multiply_refs]
         assert any(
-            "Calculator.hs" in path for path in multiply_ref_paths
-        ), f"Expected 'multiply' to be referenced in Calculator.hs, got: {multiply_ref_paths}"
+            "Calculator.hs" in ref["relativePath"] for ref in multiply_refs
+        ), f"Expected 'multiply' to be referenced in Calculator.hs, got: {[ref['relativePath'] for ref in multiply_refs]}"
 
-    @pytest.mark.parametrize("language_server", [Language.HASKELL], indirect=True)
     def test_data_type_constructor_references(self, language_server: SolidLanguageServer):
         """
         Test that Calculator data type constructor usage is tracked.
@@ -213,7 +206,6 @@ class TestHaskellLanguageServer:
         assert len(calculator_refs) >= 1, f"Expected at least 1 reference to Calculator constructor, got {len(calculator_refs)}"
 
         # Should have at least one reference in Main.hs or Calculator.hs
-        calc_ref_paths = [ref["relativePath"] for ref in calculator_refs]
         assert any(
-            "Main.hs" in path or "Calculator.hs" in path for path in calc_ref_paths
-        ), f"Expected Calculator to be referenced in Main.hs or Calculator.hs, got: {calc_ref_paths}"
+            "Main.hs" in ref["relativePath"] or "Calculator.hs" in ref["relativePath"] for ref in calculator_refs
+        ), f"Expected Calculator to be referenced in Main.hs or Calculator.hs, got: {[ref['relativePath'] for ref in calculator_refs]}"
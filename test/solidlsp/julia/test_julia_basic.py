@@ -5,8 +5,8 @@ from solidlsp.ls_config import Language
 
 
 @pytest.mark.julia
+@pytest.mark.parametrize("language_server", [Language.JULIA], indirect=True)
 class TestJuliaLanguageServer:
-    @pytest.mark.parametrize("language_server", [Language.JULIA], indirect=True)
     def test_julia_symbols(self, language_server: SolidLanguageServer):
         """
         Test if we can find the top-level symbols in the main.jl file.
@@ -16,7 +16,6 @@ class TestJuliaLanguageServer:
         assert "calculate_sum" in symbol_names
         assert "main" in symbol_names
 
-    @pytest.mark.parametrize("language_server", [Language.JULIA], indirect=True)
     def test_julia_within_file_references(self, language_server: SolidLanguageServer):
         """
         Test finding references to a function within the same file.
@@ -32,7 +31,6 @@ class TestJuliaLanguageServer:
         reference_paths = [ref["relativePath"] for ref in references]
         assert "main.jl" in reference_paths
 
-    @pytest.mark.parametrize("language_server", [Language.JULIA], indirect=True)
     def test_julia_cross_file_references(self, language_server: SolidLanguageServer):
         """
         Test finding references to a function defined in another file.
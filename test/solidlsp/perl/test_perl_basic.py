@@ -1,3 +1,4 @@
+import logging
 import platform
 from pathlib import Path
 
@@ -6,9 +7,12 @@ import pytest
 from solidlsp import SolidLanguageServer
 from solidlsp.ls_config import Language
 
+log = logging.getLogger(__name__)
+
 
 @pytest.mark.perl
 @pytest.mark.skipif(platform.system() == "Windows", reason="Perl::LanguageServer does not support native Windows operation")
+@pytest.mark.parametrize("language_server", [Language.PERL], indirect=True)
 class TestPerlLanguageServer:
     """
     Tests for Perl::LanguageServer integration.
@@ -19,7 +23,6 @@ class TestPerlLanguageServer:
     - Find references (including cross-file) - this was not available in PLS
     """
 
-    @pytest.mark.parametrize("language_server", [Language.PERL], indirect=True)
     @pytest.mark.parametrize("repo_path", [Language.PERL], indirect=True)
     def test_ls_is_running(self, language_server: SolidLanguageServer, repo_path: Path) -> None:
         """Test that the language server starts and stops successfully."""
@@ -27,7 +30,6 @@ class TestPerlLanguageServer:
         assert language_server.is_running()
         assert Path(language_server.language_server.repository_root_path).resolve() == repo_path.resolve()
 
-    @pytest.mark.parametrize("language_server", [Language.PERL], indirect=True)
     def test_document_symbols(self, language_server: SolidLanguageServer) -> None:
         """Test that document symbols are correctly identified."""
         # Request document symbols
@@ -36,32 +38,26 @@ class TestPerlLanguageServer:
         assert all_symbols, "Expected to find symbols in main.pl"
         assert len(all_symbols) > 0, "Expected at least one symbol"
 
-        # DEBUG: Print all symbols
-        print("\n=== All symbols in main.pl ===")
-        for s in all_symbols:
-            line = s.get("range", {}).get("start", {}).get("line", "?")
-            print(f"Line {line}: {s.get('name')} (kind={s.get('kind')})")
+        log.debug("All symbols in main.pl: %s", all_symbols)
 
         # Check that we can find function symbols
         function_symbols = [s for s in all_symbols if s.get("kind") == 12]  # 12 = Function/Method
         assert len(function_symbols) >= 2, f"Expected at least 2 functions (greet, use_helper_function), found {len(function_symbols)}"
 
-        function_names = [s.get("name") for s in function_symbols]
-        assert "greet" in function_names, f"Expected 'greet' function in symbols, found: {function_names}"
-        assert "use_helper_function" in function_names, f"Expected 'use_helper_function' in symbols, found: {function_names}"
+        function_names = {s.get("name") for s in function_symbols}
+        missing = {"greet", "use_helper_function"} - function_names
+        assert not missing, f"Expected functions {missing} in symbols, found: {function_names}"
 
     # @pytest.mark.skip(reason="Perl::LanguageServer cross-file definition tracking needs configuration")
-    @pytest.mark.parametrize("language_server", [Language.PERL], indirect=True)
     def test_find_definition_across_files(self, language_server: SolidLanguageServer) -> None:
         definition_location_list = language_server.request_definition("main.pl", 17, 0)
 
         assert len(definition_location_list) == 1
         definition_location = definition_location_list[0]
-        print(f"Found definition: {definition_location}")
+        log.debug("Found definition: %s", definition_location)
         assert definition_location["uri"].endswith("helper.pl")
         assert definition_location["range"]["start"]["line"] == 4  # add method on line 2 (0-indexed 1)
 
-    @pytest.mark.parametrize("language_server", [Language.PERL], indirect=True)
     def test_find_references_across_files(self, language_server: SolidLanguageServer) -> None:
         """Test finding references to a function across multiple files."""
         reference_locations = language_server.request_references("helper.pl", 4, 5)
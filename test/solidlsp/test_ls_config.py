@@ -0,0 +1,17 @@
+from solidlsp.ls_config import FilenameMatcher, Language
+
+
+class TestFilenameMatcher:
+    def test_is_relevant_filename(self) -> None:
+        matcher = FilenameMatcher("*.py", "*.pyi")
+        assert matcher.is_relevant_filename("module.py")
+        assert matcher.is_relevant_filename("/some/path/module.pyi")
+        assert not matcher.is_relevant_filename("module.pyc")
+        assert not matcher.is_relevant_filename("py")
+
+    def test_no_patterns(self) -> None:
+        assert not FilenameMatcher().is_relevant_filename("module.py")
+
+    def test_source_fn_matcher_is_reused(self) -> None:
+        assert Language.TYPESCRIPT.get_source_fn_matcher() is Language.TYPESCRIPT.get_source_fn_matcher()
+        assert Language.TYPESCRIPT.get_source_fn_matcher().is_relevant_filename("index.mjs")
@@ -0,0 +1,13 @@
+from solidlsp.ls_utils import SymbolUtils
+
+
+def _symbol(name: str, *children: dict) -> dict:
+    return {"name": name, "children": list(children)}
+
+
+def test_get_symbol_tree_names() -> None:
+    roots = [_symbol("Outer", _symbol("inner", _symbol("deep"))), _symbol("other")]
+    names = SymbolUtils.get_symbol_tree_names(roots)  # type: ignore[arg-type]
+    assert names == {"Outer", "inner", "deep", "other"}
+    for name in names:
+        assert SymbolUtils.symbol_tree_contains_name(roots, name)  # type: ignore[arg-type]
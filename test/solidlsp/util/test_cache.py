@@ -0,0 +1,45 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from sensai.util.pickle import dump_pickle
+
+from solidlsp.util.cache import load_cache, save_cache
+
+
+def test_save_and_load_cache(tmp_path: Path) -> None:
+    """A cache saved with a given version should be loadable with the same version."""
+    cache_file = str(tmp_path / "sub" / "cache.pkl")
+    obj = {"a": [1, 2, 3], "b": ("x", "y")}
+    save_cache(cache_file, (1, "ls"), obj)
+
+    assert load_cache(cache_file, (1, "ls")) == obj
+
+
+def test_save_cache_concurrently_from_threads(tmp_path: Path) -> None:
+    """Threads of the same process saving the same cache concurrently should not interfere with each other."""
+    cache_file = str(tmp_path / "cache.pkl")
+    objects = [list(range(i, i + 10000)) for i in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for future in [pool.submit(save_cache, cache_file, 1, obj) for obj in objects]:
+            future.result()
+
+    assert load_cache(cache_file, 1) in objects
+    assert os.listdir(tmp_path) == ["cache.pkl"], "Temporary files should not be left behind"
+
+
+def test_load_cache_outdated_version(tmp_path: Path) -> None:
+    """A cache saved with a different version should be ignored."""
+    cache_file = str(tmp_path / "cache.pkl")
+    save_cache(cache_file, 1, ["data"])
+
+    assert load_cache(cache_file, 2) is None
+
+
+def test_load_cache_legacy_format(tmp_path: Path) -> None:
+    """Caches in the legacy single-dictionary format should still be loadable."""
+    cache_file = str(tmp_path / "cache.pkl")
+    dump_pickle({"__cache_version": 3, "obj": ["data"]}, cache_file)
+
+    assert load_cache(cache_file, 3) == ["data"]
+    assert load_cache(cache_file, 4) is None